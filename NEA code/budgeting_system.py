@@ -5,6 +5,7 @@ Business logic for the Smart Budgeting System.
 import datetime
 import csv
 import math
+import re
 # ReportLab imports - package is required (listed in requirements.txt)
 from reportlab.lib import colors  # type: ignore
 from reportlab.lib.pagesizes import letter  # type: ignore
@@ -14,6 +15,12 @@ from reportlab.lib.styles import getSampleStyleSheet  # type: ignore
 from database import DatabaseManager
 from security import SecurityManager
 
+# Anything that is not part of a number (currency symbols, spaces, letters).
+_AMOUNT_JUNK_RE = re.compile(r"[^0-9,.\-]")
+
+# How many of the newest transactions a report shows on screen.
+REPORT_RECENT_TRANSACTIONS = 10
+
 
 class BudgetingSystem:
     """Core business logic for the Smart Budgeting System."""
@@ -112,6 +119,11 @@ class BudgetingSystem:
             )
         elif failed_attempts:
             self.db.reset_lockout(user[0])
+
+        # Upgrade old SHA-256 hashes to scrypt now that we know the password.
+        if self.security.is_legacy_hash(user[3]):
+            salt = self.security.generate_salt()
+            self.db.update_password(user[0], self.security.hash_password(password, salt), salt)
         
         # Save login info and create a new session token.
         self.current_user_id = user[0]
@@ -293,9 +305,18 @@ class BudgetingSystem:
         self.db.delete_default_rule(rule_id, self.current_user_id)
         return True, "Rule deleted successfully"
 
-    def resolve_default_category(self, description, category_id):
-        """Resolve category based on default rules for a description."""
-        return self._apply_default_rules(description, category_id)
+    def resolve_default_category(self, description, category_id, rules=None):
+        """Resolve category based on default rules for a description.
+
+        Pass rules from prepare_default_rules() when resolving many rows.
+        """
+        return self._apply_default_rules(description, category_id, rules)
+
+    def prepare_default_rules(self):
+        """Load the default rules once as (keyword, category_id), longest keyword first."""
+        rules = self.get_default_rules() or []
+        sorted_rules = sorted(rules, key=lambda rule: len(rule[2] or ""), reverse=True)
+        return [(rule[2].lower(), rule[3]) for rule in sorted_rules if rule[2]]
 
     def get_csv_import_schema(self):
         """Return CSV fields and header aliases for import mapping."""
@@ -341,6 +362,8 @@ class BudgetingSystem:
         required_fields = set(schema.get("required", []))
         parsed_rows = []
         errors = []
+        # Bank exports repeat the same dates a lot, so only parse each one once.
+        date_cache = {}
 
         for row_number, row in enumerate(rows, start=1):
             row_errors = []
@@ -352,7 +375,10 @@ class BudgetingSystem:
                 parsed_date = None
             else:
                 try:
-                    parsed_date = self._parse_csv_date(date_value)
+                    parsed_date = date_cache.get(date_value)
+                    if parsed_date is None:
+                        parsed_date = self._parse_csv_date(date_value)
+                        date_cache[date_value] = parsed_date
                 except ValueError as exc:
                     row_errors.append(str(exc))
                     parsed_date = None
@@ -483,12 +509,19 @@ class BudgetingSystem:
     def _parse_csv_amount(self, value):
         if self._is_missing_csv_value(value):
             raise ValueError("Missing amount")
+        # pandas already gives plain numbers for numeric columns.
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            amount = float(value)
+            # pandas reads "inf"/"Infinity" as a float, which is not a real amount.
+            if not math.isfinite(amount):
+                raise ValueError("Invalid amount format")
+            return amount
         text = str(value).strip()
         negative = False
         if text.startswith("(") and text.endswith(")"):
             negative = True
             text = text[1:-1]
-        cleaned = "".join(ch for ch in text if ch.isdigit() or ch in ",.-")
+        cleaned = _AMOUNT_JUNK_RE.sub("", text)
         if cleaned.count(",") == 1 and cleaned.count(".") == 0:
             cleaned = cleaned.replace(",", ".")
         cleaned = cleaned.replace(",", "")
@@ -669,6 +702,28 @@ class BudgetingSystem:
         
         return True, "Transaction added successfully"
 
+    def add_transactions_bulk(self, rows):
+        """Add many already-validated transactions in one go.
+
+        Each row is (category_id, date, description, amount, trans_type, tag).
+        """
+        if not self.current_user_id:
+            return False, "Not logged in"
+        if not rows:
+            return True, "No transactions to import"
+
+        records = [
+            (self.current_user_id, category_id, date, description, amount, trans_type, tag)
+            for category_id, date, description, amount, trans_type, tag in rows
+        ]
+        self.db.create_transactions_bulk(records)
+
+        # Check budget alerts once per category rather than once per row.
+        for category_id in {row[0] for row in rows}:
+            self._check_budget_alerts(category_id)
+
+        return True, "Transactions imported successfully"
+
     def update_transaction(self, transaction_id, category_id, date, description, amount, tag=None):
         """Update an existing transaction with validation."""
         if not self.current_user_id:
@@ -693,19 +748,18 @@ class BudgetingSystem:
         self.db.update_transaction(transaction_id, category_id, date, description, amount, tag)
         return True, "Transaction updated successfully"
     
-    def _apply_default_rules(self, description, category_id):
+    def _apply_default_rules(self, description, category_id, rules=None):
         """Apply default categorization rules"""
         if not description:
             return category_id
-        rules = self.get_default_rules()
+        if rules is None:
+            rules = self.prepare_default_rules()
         if not rules:
             return category_id
         description_lower = str(description).lower()
-        sorted_rules = sorted(rules, key=lambda rule: len(rule[2] or ""), reverse=True)
-        for rule in sorted_rules:
-            keyword = (rule[2] or "").lower()
-            if keyword and keyword in description_lower:
-                return rule[3]  # category_id
+        for keyword, rule_category_id in rules:
+            if keyword in description_lower:
+                return rule_category_id
         return category_id
     
     def _apply_goal_contribution(self, goal_id, amount):
@@ -758,11 +812,11 @@ class BudgetingSystem:
                     # In a real app, this would show a notification
                     print(f"Budget alert: {threshold}% exceeded for category {category_id}")
     
-    def get_transactions(self, start_date=None, end_date=None, category_id=None):
+    def get_transactions(self, start_date=None, end_date=None, category_id=None, limit=None):
         """Get transactions for current user"""
         if not self.current_user_id:
             return []
-        return self.db.get_transactions(self.current_user_id, start_date, end_date, category_id)
+        return self.db.get_transactions(self.current_user_id, start_date, end_date, category_id, limit)
     
     def delete_transaction(self, transaction_id):
         """Delete transaction"""
@@ -970,26 +1024,30 @@ class BudgetingSystem:
         else:
             return None
         
-        # Get transactions
-        transactions = self.get_transactions(start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d"))
-        
-        # Calculate totals
-        income = sum(t[5] for t in transactions if t[6] == 'income')
-        expenses = sum(t[5] for t in transactions if t[6] == 'expense')
+        start_text = start.strftime("%Y-%m-%d")
+        end_text = end.strftime("%Y-%m-%d")
+        params = (self.current_user_id, start_text, end_text)
+        
+        # Calculate totals in SQL so the transactions never need to be loaded here.
+        totals_query = """
+            SELECT
+                COALESCE(SUM(CASE WHEN type = 'income' THEN amount END), 0),
+                COALESCE(SUM(CASE WHEN type = 'expense' THEN amount END), 0)
+            FROM transactions
+            WHERE user_id = ? AND date >= ? AND date <= ?
+        """
+        income, expenses = self.db.execute_query(totals_query, params, fetch_one=True)
         savings = income - expenses
         
-        # Category breakdown
-        category_totals = {}
-        for t in transactions:
-            cat_id = t[2]
-            # Get category name by ID
-            cat_query = "SELECT name FROM categories WHERE category_id = ?"
-            cat_result = self.db.execute_query(cat_query, (cat_id,), fetch_one=True)
-            cat_name = cat_result[0] if cat_result else "Unknown"
-            
-            if cat_name not in category_totals:
-                category_totals[cat_name] = 0
-            category_totals[cat_name] += t[5]
+        # Category breakdown (one grouped query instead of a lookup per transaction)
+        breakdown_query = """
+            SELECT COALESCE(c.name, 'Unknown'), SUM(t.amount)
+            FROM transactions t
+            LEFT JOIN categories c ON c.category_id = t.category_id
+            WHERE t.user_id = ? AND t.date >= ? AND t.date <= ?
+            GROUP BY COALESCE(c.name, 'Unknown')
+        """
+        category_totals = dict(self.db.execute_query(breakdown_query, params, fetch_all=True))
         
         return {
             'period': period,
@@ -999,7 +1057,10 @@ class BudgetingSystem:
             'expenses': expenses,
             'savings': savings,
             'category_breakdown': category_totals,
-            'transactions': transactions
+            # Only the latest few are shown; exports read the full list themselves.
+            'transactions': self.db.get_transactions(
+                self.current_user_id, start_text, end_text, limit=REPORT_RECENT_TRANSACTIONS
+            )
         }
     
     def export_report_pdf(self, report_data, filename):
@@ -1052,7 +1113,8 @@ class BudgetingSystem:
     
     def export_report_csv(self, report_data, filename):
         """Export report to CSV"""
-        with open(filename, 'w', newline='') as csvfile:
+        # A large write buffer means fewer disk writes for long reports.
+        with open(filename, 'w', newline='', buffering=1 << 20) as csvfile:
             writer = csv.writer(csvfile)
             
             # Write header
@@ -1070,15 +1132,22 @@ class BudgetingSystem:
             # Write category breakdown
             writer.writerow(['Category Breakdown'])
             writer.writerow(['Category', 'Amount'])
-            for category, amount in report_data['category_breakdown'].items():
-                writer.writerow([category, amount])
+            writer.writerows(report_data['category_breakdown'].items())
             writer.writerow([])
             
-            # Write transactions
+            # Write transactions, streamed from the database so they are never all in memory
             writer.writerow(['Transactions'])
             writer.writerow(['Date', 'Description', 'Category', 'Amount', 'Type'])
-            for t in report_data['transactions']:
-                writer.writerow([t[3], t[4], t[2], t[5], t[6]])
+            transactions = self.db.iter_transactions(
+                self.current_user_id,
+                report_data['start_date'].strftime("%Y-%m-%d"),
+                report_data['end_date'].strftime("%Y-%m-%d")
+            )
+            try:
+                writer.writerows((t[3], t[4], t[2], t[5], t[6]) for t in transactions)
+            finally:
+                # Close the generator so its connection is released straight away.
+                transactions.close()
         
         return True
     
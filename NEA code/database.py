@@ -92,6 +92,12 @@ class DatabaseManager:
         """)
         self._ensure_transaction_goal_column(cursor)
 
+        # Index so filtering by user, date range and category avoids a full scan.
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_tx_user_date_cat
+            ON transactions (user_id, date, category_id)
+        """)
+
         # Budgets table keeps user-set limits for categories.
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS budgets (
@@ -553,8 +559,38 @@ class DatabaseManager:
         """
         return self.execute_query(query, (user_id, category_id, date, description, amount, trans_type, tag, goal_id))
 
-    def get_transactions(self, user_id, start_date=None, end_date=None, category_id=None):
-        """Return transactions with optional date and category filters."""
+    def create_transactions_bulk(self, rows):
+        """Insert many transaction rows in one database transaction.
+
+        Each row is (user_id, category_id, date, description, amount, type, tag).
+        """
+        query = """
+            INSERT INTO transactions (user_id, category_id, date, description, amount, type, tag)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """
+        conn = self.get_connection()
+        # Bulk loads are much faster without a disk sync after every page write.
+        synchronous = conn.execute("PRAGMA synchronous").fetchone()[0]
+        journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.execute("PRAGMA journal_mode = MEMORY")
+        try:
+            cursor = conn.cursor()
+            # One commit for the whole batch instead of one per row.
+            cursor.executemany(query, rows)
+            conn.commit()
+            return cursor.rowcount
+        except sqlite3.Error as error:
+            conn.rollback()
+            raise Exception(f"Database error: {error}")
+        finally:
+            # Put the safer settings back before the connection is closed.
+            conn.execute(f"PRAGMA journal_mode = {journal_mode}")
+            conn.execute(f"PRAGMA synchronous = {synchronous}")
+            conn.close()
+
+    def _transactions_query(self, user_id, start_date=None, end_date=None, category_id=None):
+        """Build the SELECT (and its params) used to list a user's transactions."""
         query = "SELECT * FROM transactions WHERE user_id = ?"
         params = [user_id]
 
@@ -569,8 +605,32 @@ class DatabaseManager:
             params.append(category_id)
 
         query += " ORDER BY date DESC"
+        return query, params
+
+    def get_transactions(self, user_id, start_date=None, end_date=None, category_id=None, limit=None):
+        """Return transactions with optional date, category and row limit filters."""
+        query, params = self._transactions_query(user_id, start_date, end_date, category_id)
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
         return self.execute_query(query, params, fetch_all=True)
 
+    def iter_transactions(self, user_id, start_date=None, end_date=None, category_id=None, batch_size=500):
+        """Yield transactions one at a time, reading them from SQLite in batches."""
+        query, params = self._transactions_query(user_id, start_date, end_date, category_id)
+        conn = self.get_connection()
+        try:
+            cursor = conn.execute(query, params)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from rows
+        except sqlite3.Error as error:
+            raise Exception(f"Database error: {error}")
+        finally:
+            conn.close()
+
     def update_transaction(self, transaction_id, category_id, date, description, amount, tag):
         """Edit an existing transaction."""
         query = """
@@ -761,33 +821,74 @@ class DatabaseManager:
     # Backup and restore
     # -----------------------
     def backup_database(self, backup_path):
-        """Write a plain text backup of the database to a file."""
+        """Copy the database to a backup file (.sql paths get a plain text dump)."""
         try:
             conn = self.get_connection()
-            with open(backup_path, "w") as file_handle:
-                for line in conn.iterdump():
-                    file_handle.write(f"{line}\n")
+            if backup_path.lower().endswith(".sql"):
+                # Older text format, kept so .sql backups still work.
+                # A 1 MiB buffer means far fewer write calls on big dumps.
+                with open(backup_path, "w", buffering=1 << 20) as file_handle:
+                    file_handle.writelines(f"{line}\n" for line in conn.iterdump())
+            else:
+                # SQLite's online backup copies whole pages, 1024 at a time.
+                backup_conn = sqlite3.connect(backup_path)
+                conn.backup(backup_conn, pages=1024)
+                backup_conn.close()
             conn.close()
             return True
         except Exception as error:
             print(f"Backup error: {error}")
             return False
 
+    def _is_sqlite_file(self, path):
+        """Check the file header to see if it is a SQLite database."""
+        with open(path, "rb") as file_handle:
+            return file_handle.read(16) == b"SQLite format 3\x00"
+
     def restore_database(self, backup_path):
         """Restore the database from a backup file."""
         try:
+            if self._is_sqlite_file(backup_path):
+                # Page-level copy straight over the current database.
+                backup_conn = sqlite3.connect(backup_path)
+                main_conn = self.get_connection()
+                backup_conn.backup(main_conn, pages=1024)
+                main_conn.close()
+                backup_conn.close()
+                return True
+
             # Build a temporary database in memory first.
             temp_conn = sqlite3.connect(":memory:")
             with open(backup_path, "r") as file_handle:
                 temp_conn.executescript(file_handle.read())
+            # iterdump wraps everything in one BEGIN ... COMMIT.
+            script = "\n".join(temp_conn.iterdump())
+            temp_conn.close()
 
-            # Copy the temporary dump into the real database.
+            # Copy the temporary dump into the real database as one script.
             main_conn = self.get_connection()
-            for line in temp_conn.iterdump():
-                main_conn.execute(line)
-            main_conn.commit()
-            main_conn.close()
-            temp_conn.close()
+            synchronous = main_conn.execute("PRAGMA synchronous").fetchone()[0]
+            journal_mode = main_conn.execute("PRAGMA journal_mode").fetchone()[0]
+            temp_store = main_conn.execute("PRAGMA temp_store").fetchone()[0]
+            main_conn.execute("PRAGMA synchronous = OFF")
+            main_conn.execute("PRAGMA journal_mode = MEMORY")
+            main_conn.execute("PRAGMA temp_store = MEMORY")
+            # The dump lists tables alphabetically, so child rows can come before
+            # their parent tables exist; the dump itself is already consistent.
+            main_conn.execute("PRAGMA foreign_keys = OFF")
+            try:
+                main_conn.executescript(script)
+            except sqlite3.Error:
+                if main_conn.in_transaction:
+                    main_conn.rollback()
+                raise
+            finally:
+                # Put the safer settings back before the connection is closed.
+                main_conn.execute(f"PRAGMA temp_store = {temp_store}")
+                main_conn.execute(f"PRAGMA journal_mode = {journal_mode}")
+                main_conn.execute(f"PRAGMA synchronous = {synchronous}")
+                main_conn.execute("PRAGMA foreign_keys = ON")
+                main_conn.close()
             return True
         except Exception as error:
             print(f"Restore error: {error}")
@@ -6,6 +6,9 @@ Logic stays the same, but comments explain the flow in a simple way.
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import datetime
+import hashlib
+import hmac
+import os
 import threading
 import time
 import pandas as pd
@@ -13,8 +16,26 @@ import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.patches import Circle
 
+from gui.status_debouncer import StatusDebouncer
 from gui.translations import DEFAULT_LANGUAGE, LANGUAGE_MAP, translate_text
 
+# How many transaction rows to add to the tree at a time while scrolling.
+TRANSACTION_PAGE_SIZE = 200
+
+# Wrong unlock passwords are remembered briefly so repeats skip the hash.
+UNLOCK_FAILURE_CACHE_SIZE = 4
+UNLOCK_FAILURE_TTL = 1.0
+
+# Backups are SQLite files; .sql text dumps are still accepted.
+BACKUP_FILETYPES = [
+    ("SQLite database", "*.db *.sqlite"),
+    ("SQL files", "*.sql"),
+    ("All files", "*.*"),
+]
+
+# Date formats accepted in the transaction filter boxes.
+DATE_INPUT_FORMATS = ("%Y-%m-%d", "%d/%m/%Y", "%d-%m-%Y", "%d.%m.%Y", "%Y/%m/%d")
+
 
 class BudgetingApp:
     """Main Application Interface for all tabs and windows."""
@@ -46,6 +67,40 @@ class BudgetingApp:
         self.goals_cards_frame = None
         self.goal_card_figs = []
         self.trans_goal_map = {}
+        self._tx_items = {}
+        self._tx_last_filter = None
+        # Filtered transactions and how many of them are currently in the tree.
+        self._filtered_tx = []
+        self._tx_loaded = 0
+        # Pending after_idle() id while a "load more rows" call is waiting for Tk.
+        self._tx_load_after_id = None
+        # Pending after() id so quick filter changes only run one query.
+        self._filter_after_id = None
+        self._session_after_id = None
+        # Status label changes are drawn once per burst of messages.
+        self._status = StatusDebouncer(self.root)
+        # Recent wrong unlock passwords as (keyed digest, time) pairs.
+        self._unlock_failures = []
+        self._unlock_cache_key = os.urandom(16)
+        # Dialogs that are hidden instead of destroyed so they open faster.
+        self._dialogs = {}
+        # Which notebook tabs need reloading the next time they are shown.
+        self._tab_names = {}
+        self._tab_dirty = {
+            "dashboard": True,
+            "transactions": True,
+            "categories": True,
+            "budgets": True,
+            "goals": True,
+        }
+        # Categories rarely change, so keep them until a category is edited.
+        self._categories_cache = None
+        self._categories_dirty = True
+        self._cat_id_to_name = {}
+        self._cat_name_to_id = {}
+        self._cat_parent_of = {}
+        self._category_names_tuple = ()
+        self._category_names_with_none = ("None",)
         self.dashboard_date_range = None
         self.category_date_range = None
         self.category_tabs = {}
@@ -86,6 +141,13 @@ class BudgetingApp:
         
         # Load data once the UI is ready.
         self.refresh_data()
+        self.root.after_idle(self._warm_dialogs)
+
+    def _warm_dialogs(self):
+        """Load Tk's file dialog code while idle so the first backup opens quickly."""
+        # On Linux the dialogs are Tcl scripts loaded on first use; on Windows and
+        # macOS they are built in, so the catch makes this a no-op there.
+        self.root.tk.eval("catch {auto_load ::tk::dialog::file::}")
 
     def _configure_notebook_style(self):
         """Create a bold navigation tab style for the main menus."""
@@ -140,6 +202,7 @@ class BudgetingApp:
         file_menu.add_separator()
         file_menu.add_command(label="Logout", command=self.logout)
         file_menu.add_command(label="Exit", command=self.root.quit)
+        self.file_menu = file_menu
         
         # Settings menu
         settings_menu = tk.Menu(menubar, tearoff=0)
@@ -297,12 +360,12 @@ class BudgetingApp:
     
     def _is_valid_category_parent(self, category_id, parent_id):
         """Check if the new parent selection would create a loop"""
+        self._cached_categories()
         current = parent_id
         while current:
             if current == category_id:
                 return False
-            parent = self.system.db.get_category_by_id(current)
-            current = parent[1] if parent else None
+            current = self._cat_parent_of.get(current)
         return True
     
     def _t(self, key):
@@ -671,6 +734,16 @@ class BudgetingApp:
         self.reports_frame = ttk.Frame(self.notebook, padding=10)
         self.notebook.add(self.reports_frame, text="Reports")
         self.create_reports_tab()
+
+        # Hidden tabs are only refreshed once the user switches to them.
+        self._tab_names = {
+            str(self.dashboard_frame): "dashboard",
+            str(self.transactions_frame): "transactions",
+            str(self.categories_frame): "categories",
+            str(self.budgets_frame): "budgets",
+            str(self.goals_frame): "goals",
+        }
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_change)
     
     def create_dashboard(self):
         """Create dashboard styled like the provided hand-drawn concept"""
@@ -1098,10 +1171,11 @@ class BudgetingApp:
         scrollbar = ttk.Scrollbar(tree_frame)
         scrollbar.pack(side="right", fill="y")
 
+        self.transactions_scrollbar = scrollbar
         self.transactions_tree = ttk.Treeview(
             tree_frame,
             columns=('ID', 'Date', 'Description', 'Category', 'Amount', 'Type', 'Tag'),
-            yscrollcommand=scrollbar.set,
+            yscrollcommand=self._on_transactions_scroll,
             height=15
         )
         self.transactions_tree.pack(side="left", fill="both", expand=True)
@@ -2325,16 +2399,67 @@ class BudgetingApp:
             self.budgets_period_label.config(text=self._format_date_range_label(start_date, end_date))
     
     def refresh_data(self):
-        """Refresh all data displays"""
-        self.refresh_dashboard()
-        self.refresh_category_charts()
-        self.refresh_transactions()
-        self.refresh_categories()
-        self.refresh_default_rules()
-        self.refresh_budgets()
-        self.refresh_goals()
+        """Refresh all data displays (hidden tabs catch up when opened)"""
         self.refresh_comboboxes()
-    
+        self._refresh_tabs(*self._tab_dirty)
+
+    def _refresh_tabs(self, *tab_names):
+        """Mark tabs as out of date and refresh the one on screen straight away."""
+        for name in tab_names:
+            self._tab_dirty[name] = True
+        current = self._tab_names.get(str(self.notebook.select()))
+        if current in tab_names:
+            self._refresh_tab(current)
+
+    def _refresh_tab(self, name):
+        """Reload everything shown on one notebook tab."""
+        self._tab_dirty[name] = False
+        if name == "dashboard":
+            self.refresh_dashboard()
+        elif name == "transactions":
+            # Keep whatever filters the user has set on the transactions tab.
+            self._reset_transaction_items()
+            self._do_apply_filters()
+        elif name == "categories":
+            self.refresh_category_charts()
+            self.refresh_categories()
+            self.refresh_default_rules()
+        elif name == "budgets":
+            self.refresh_budgets()
+        elif name == "goals":
+            self.refresh_goals()
+
+    def _on_tab_change(self, event=None):
+        """Refresh a tab when it is opened if its data changed while hidden."""
+        name = self._tab_names.get(str(self.notebook.select()))
+        if self._tab_dirty.get(name):
+            self._refresh_tab(name)
+
+    def _refresh_transaction_views(self):
+        """Refresh only the views that show transaction data."""
+        self._refresh_tabs("transactions", "dashboard", "categories", "budgets", "goals")
+
+    def _refresh_after_import(self):
+        """Refresh views after a CSV import (which may add categories too)."""
+        if self._categories_dirty:
+            self.refresh_comboboxes()
+        self._refresh_transaction_views()
+
+    def _refresh_category_views(self):
+        """Refresh the category list, every category picker and the transaction list."""
+        self.refresh_comboboxes()
+        # Transactions show category names and may be filtered by the changed category.
+        self._refresh_tabs("categories", "transactions")
+
+    def _refresh_budget_views(self):
+        """Refresh the budgets tab and the dashboard budget donut."""
+        self._refresh_tabs("budgets", "dashboard")
+
+    def _refresh_goal_views(self):
+        """Refresh the goals tab, dashboard goal card and goal pickers."""
+        self._refresh_tabs("goals", "dashboard")
+        self._refresh_goal_contribution_options()
+
     def refresh_dashboard(self):
         """Refresh dashboard data"""
         # Get current month data
@@ -2773,22 +2898,65 @@ class BudgetingApp:
             )
             self.goal_card_figs.append(fig)
 
-    def refresh_transactions(self):
-        """Refresh transactions list"""
-        for child in self.transactions_tree.get_children():
-            self.transactions_tree.delete(child)
-        
-        transactions = self.system.get_transactions()
-        for t in transactions:
-            cat_name = self.get_category_name(t[2])
-            self.transactions_tree.insert('', 'end', values=(t[0], t[3], t[4], cat_name, f"£{t[5]:.2f}", t[6], t[7] or ''))
+    def _reset_transaction_items(self):
+        """Delete all cached transaction rows (shown or hidden)."""
+        if self._tx_items:
+            self.transactions_tree.delete(*self._tx_items.values())
+        self._tx_items = {}
+        self._tx_last_filter = None
+
+    def _show_transactions(self, transactions):
+        """Show the given transactions, loading only the first page straight away."""
+        self._filtered_tx = transactions
+        self._tx_loaded = 0
+        # A queued page load belongs to the old list, so drop it.
+        if self._tx_load_after_id:
+            self.root.after_cancel(self._tx_load_after_id)
+        self._load_more_transactions(rebuild=True)
+        self.transactions_tree.yview_moveto(0)
+
+    def _load_more_transactions(self, rebuild=False):
+        """Add the next page of filtered transactions to the tree."""
+        self._tx_load_after_id = None
+        self._tx_loaded = min(len(self._filtered_tx), self._tx_loaded + TRANSACTION_PAGE_SIZE)
+        visible = self._filtered_tx[:self._tx_loaded]
+
+        tree = self.transactions_tree
+        # Only brand new transactions need a new tree row.
+        new_rows = [t for t in visible if t[0] not in self._tx_items]
+        pack_info = None
+        if new_rows and rebuild:
+            # Unmap the tree while rebuilding it so Tk skips layout work per insert.
+            # Pages added while scrolling are appended in place to avoid flicker.
+            pack_info = tree.pack_info()
+            tree.pack_forget()
+        try:
+            for t in new_rows:
+                cat_name = self.get_category_name(t[2])
+                self._tx_items[t[0]] = tree.insert(
+                    '', 'end', values=(t[0], t[3], t[4], cat_name, f"£{t[5]:.2f}", t[6], t[7] or '')
+                )
+        finally:
+            if pack_info is not None:
+                tree.pack(**pack_info)
+        # One call swaps the visible rows; rows left out are detached, not deleted.
+        tree.set_children('', *[self._tx_items[t[0]] for t in visible])
+
+    def _on_transactions_scroll(self, first, last):
+        """Keep the scrollbar in sync and load more rows near the bottom."""
+        self.transactions_scrollbar.set(first, last)
+        if (float(last) >= 0.9 and self._tx_loaded < len(self._filtered_tx)
+                and not self._tx_load_after_id):
+            # Wait until Tk is idle so rows are not added in the middle of a redraw.
+            # Keeping the id stops one fast scroll from queueing several pages at once.
+            self._tx_load_after_id = self.root.after_idle(self._load_more_transactions)
     
     def refresh_categories(self):
         """Refresh categories list"""
         for child in self.categories_tree.get_children():
             self.categories_tree.delete(child)
         
-        categories = self.system.get_categories()
+        categories = self._cached_categories()
         for cat in categories:
             # cat structure: (category_id, parent_category_id, name, type)
             parent_name = self.get_category_name(cat[1]) if cat[1] else ""
@@ -2802,7 +2970,7 @@ class BudgetingApp:
             self.rules_tree.delete(child)
 
         rules = self.system.get_default_rules()
-        categories = self.system.get_categories()
+        categories = self._cached_categories()
         category_lookup = {cat[0]: cat[2] for cat in categories}
         for rule in rules:
             rule_id = rule[0]
@@ -2862,20 +3030,21 @@ class BudgetingApp:
     def refresh_comboboxes(self):
         """Refresh all combobox data"""
         # Categories
-        categories = self.system.get_categories()
-        # cat structure: (category_id, parent_category_id, name, type)
-        category_names = [c[2] for c in categories]  # name column (index 2)
+        self._cached_categories()
+        category_names = self._category_names_tuple
         
         self.trans_category_combo['values'] = category_names
-        self.filter_category_combo['values'] = ["All"] + category_names
-        self.filter_category_combo.set("All")
+        self.filter_category_combo['values'] = ("All",) + category_names
+        # Keep the transactions filter unless its category has gone.
+        if self.filter_category_combo.get() not in category_names:
+            self.filter_category_combo.set("All")
         
         self.budget_category_combo['values'] = category_names
         
-        self.goal_category_combo['values'] = ["None"] + category_names
+        self.goal_category_combo['values'] = self._category_names_with_none
         self.goal_category_combo.set("None")
         
-        self.parent_category_combo['values'] = ["None"] + category_names
+        self.parent_category_combo['values'] = self._category_names_with_none
         self.parent_category_combo.set("None")
 
         if hasattr(self, "rule_category_combo"):
@@ -2890,10 +3059,33 @@ class BudgetingApp:
 
         self._refresh_goal_contribution_options()
     
+    def _cached_categories(self):
+        """Return the user's categories, only asking the database after a change."""
+        if self._categories_dirty or self._categories_cache is None:
+            categories = self.system.get_categories()
+            self._categories_cache = categories
+            self._cat_id_to_name = {c[0]: c[2] for c in categories}
+            self._cat_parent_of = {c[0]: c[1] for c in categories}
+            # Ready-made combobox values (cat structure: id, parent id, name, type).
+            self._category_names_tuple = tuple(c[2] for c in categories)
+            self._category_names_with_none = ("None",) + self._category_names_tuple
+            # Names are case-insensitive; the user's own category wins over a default one.
+            self._cat_name_to_id = {}
+            for c in categories:
+                key = c[2].lower()
+                if key not in self._cat_name_to_id or c[4] is not None:
+                    self._cat_name_to_id[key] = c[0]
+            self._categories_dirty = False
+        return self._categories_cache
+
     def get_category_name(self, category_id):
         """Get category name by ID"""
         if not category_id:
             return "None"
+        self._cached_categories()
+        name = self._cat_id_to_name.get(category_id)
+        if name is not None:
+            return name
         cat = self.db.execute_query("SELECT name FROM categories WHERE category_id = ?", (category_id,), fetch_one=True)
         return cat[0] if cat else "Unknown"
 
@@ -2958,7 +3150,7 @@ class BudgetingApp:
         if success:
             messagebox.showinfo("Success", message)
             self.clear_transaction_form()
-            self.refresh_data()
+            self._refresh_transaction_views()
         else:
             messagebox.showerror("Error", message)
     
@@ -3029,7 +3221,7 @@ class BudgetingApp:
             if success:
                 messagebox.showinfo("Success", message)
                 dialog.destroy()
-                self.refresh_data()
+                self._refresh_transaction_views()
             else:
                 messagebox.showerror("Error", message)
         
@@ -3047,7 +3239,7 @@ class BudgetingApp:
             trans_id = item['values'][0]
             
             self.system.delete_transaction(trans_id)
-            self.refresh_data()
+            self._refresh_transaction_views()
             messagebox.showinfo("Success", "Transaction deleted")
     
     def show_context_menu(self, event):
@@ -3059,37 +3251,52 @@ class BudgetingApp:
             self.context_menu.grab_release()
     
     def apply_transaction_filters(self, event=None):
-        """Apply filters to transactions"""
+        """Apply filters to transactions once the user stops changing them."""
+        if self._filter_after_id:
+            self.root.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.root.after(200, self._do_apply_filters)
+
+    def _do_apply_filters(self):
+        """Run the transaction query for the current filter values."""
+        self._filter_after_id = None
         category = self.filter_category_combo.get()
-        from_date = self.filter_from_entry.get()
-        to_date = self.filter_to_entry.get()
+        # Dates are stored as YYYY-MM-DD text, so compare against that form.
+        from_date = self._norm_date(self.filter_from_entry.get())
+        to_date = self._norm_date(self.filter_to_entry.get())
         
         category_id = None
         if category != "All":
-            cat = self.system.get_category_by_name(category)
-            if cat:
-                category_id = cat[0]
+            self._cached_categories()
+            category_id = self._cat_name_to_id.get(category.lower())
         
-        # Clear and reload with filters
-        for child in self.transactions_tree.get_children():
-            self.transactions_tree.delete(child)
-        
-        transactions = self.system.get_transactions(
+        filters = (
             from_date if from_date else None,
             to_date if to_date else None,
             category_id
         )
+        if filters == self._tx_last_filter:
+            return
         
-        for t in transactions:
-            cat_name = self.get_category_name(t[2])
-            self.transactions_tree.insert('', 'end', values=(t[0], t[3], t[4], cat_name, f"£{t[5]:.2f}", t[6], t[7] or ''))
+        transactions = self.system.get_transactions(*filters)
+        self._show_transactions(transactions)
+        self._tx_last_filter = filters
     
+    def _norm_date(self, text):
+        """Turn a typed date into YYYY-MM-DD (left as typed if no format matches)."""
+        text = text.strip()
+        for fmt in DATE_INPUT_FORMATS:
+            try:
+                return datetime.datetime.strptime(text, fmt).strftime("%Y-%m-%d")
+            except ValueError:
+                continue
+        return text
+
     def clear_transaction_filters(self):
         """Clear transaction filters"""
         self.filter_category_combo.set("All")
         self.filter_from_entry.delete(0, tk.END)
         self.filter_to_entry.delete(0, tk.END)
-        self.refresh_transactions()
+        self.apply_transaction_filters()
     
     def import_csv(self):
         """Import transactions from CSV"""
@@ -3102,12 +3309,13 @@ class BudgetingApp:
             return
         
         try:
-            df = pd.read_csv(filename)
+            # Only read the header row for now; the data is loaded after mapping.
+            columns = pd.read_csv(filename, nrows=0).columns.tolist()
             
             schema = self.system.get_csv_import_schema()
             required_columns = schema.get("required", [])
             optional_columns = schema.get("optional", [])
-            suggested_mapping = self.system.suggest_csv_mapping(list(df.columns))
+            suggested_mapping = self.system.suggest_csv_mapping(columns)
             
             # Show column mapping dialog
             dialog = tk.Toplevel(self.root)
@@ -3132,11 +3340,11 @@ class BudgetingApp:
                     label_text = f"{field} (optional)"
                 ttk.Label(mapping_frame, text=f"{label_text}:").grid(row=i, column=0, sticky="w", pady=5)
                 var = tk.StringVar()
-                combo = ttk.Combobox(mapping_frame, values=list(df.columns), width=30, textvariable=var)
+                combo = ttk.Combobox(mapping_frame, values=columns, width=30, textvariable=var)
                 combo.grid(row=i, column=1, pady=5, padx=5)
                 if field in suggested_mapping:
                     var.set(suggested_mapping[field])
-                elif field in df.columns:
+                elif field in columns:
                     var.set(field)
                 column_vars[field] = var
             
@@ -3158,6 +3366,10 @@ class BudgetingApp:
                         return
                     
                     # Parse and validate rows
+                    # Only ask pandas for real header names; a typed-in name that isn't in the
+                    # file is simply treated as a missing value, like before.
+                    used_columns = [column for column in columns if column in mapping.values()]
+                    df = self._read_csv_columns(filename, used_columns)
                     records = df.to_dict(orient="records")
                     parsed_rows, errors = self.system.parse_csv_rows(records, mapping)
                     
@@ -3172,10 +3384,17 @@ class BudgetingApp:
                         messagebox.showerror("Import Error", "No valid rows to import.")
                         return
                     
-                    # Import each row
-                    imported = 0
+                    # Collect rows first, then save them all in one batch.
+                    pending_rows = []
                     skipped = len(errors)
-                    
+                    category_ids = {}
+                    # Categories made by this import, removed again if the insert fails.
+                    created_category_ids = []
+                    # Keep failures in a list (up to 100) and show them once at the end.
+                    import_errors = []
+                    # Load the default rules once instead of querying them for every row.
+                    default_rules = self.system.prepare_default_rules()
+
                     for row in parsed_rows:
                         try:
                             date = row["date"]
@@ -3184,44 +3403,56 @@ class BudgetingApp:
                             category_name = row["category"]
                             trans_type = row["type"]
                             tag = row["tag"]
-                            
-                            # Get or create category
-                            category = self.system.get_category_by_name(category_name)
-                            if not category:
-                                # Auto-create category
-                                cat_type = 'income' if trans_type == 'income' else 'expense'
-                                cat_id = self.system.db.create_category(
-                                    category_name,
-                                    cat_type,
-                                    None,
-                                    self.system.current_user_id
-                                )
-                            else:
-                                cat_id = category[0]
-                            
-                            # Add transaction with default rules applied.
-                            success, message = self.system.add_transaction(
-                                cat_id,
-                                date,
-                                description,
-                                amount,
-                                trans_type,
-                                tag,
-                                None,
-                                apply_defaults=True
-                            )
-                            if success:
-                                imported += 1
-                            else:
-                                print(f"Skipped row: {message}")
-                                skipped += 1
+
+                            # Get or create category (names are case-insensitive).
+                            cat_key = category_name.lower()
+                            cat_id = category_ids.get(cat_key)
+                            if cat_id is None:
+                                category = self.system.get_category_by_name(category_name)
+                                if not category:
+                                    # Auto-create category
+                                    cat_type = 'income' if trans_type == 'income' else 'expense'
+                                    cat_id = self.system.db.create_category(
+                                        category_name,
+                                        cat_type,
+                                        None,
+                                        self.system.current_user_id
+                                    )
+                                    created_category_ids.append(cat_id)
+                                    self._categories_dirty = True
+                                else:
+                                    cat_id = category[0]
+                                category_ids[cat_key] = cat_id
+
+                            # Apply default rules before queueing the row.
+                            cat_id = self.system.resolve_default_category(description, cat_id, default_rules)
+                            # Check here so one bad row can't fail the whole batch insert.
+                            if cat_id is None:
+                                raise ValueError(f"No category for '{description}'")
+                            pending_rows.append((cat_id, date, description, amount, trans_type, tag))
                         except Exception as e:
-                            print(f"Skipped row: {e}")
+                            if len(import_errors) < 100:
+                                import_errors.append(str(e))
                             skipped += 1
-                    
-                    messagebox.showinfo("Import Complete", f"Imported: {imported}\nSkipped: {skipped}")
+
+                    try:
+                        success, message = self.system.add_transactions_bulk(pending_rows)
+                    except Exception as e:
+                        success, message = False, str(e)
+                    if not success:
+                        # Nothing was imported, so don't leave the new categories behind.
+                        for cat_id in created_category_ids:
+                            self.system.db.delete_category(cat_id)
+                        messagebox.showerror("Import Error", message)
+                        return
+                    imported = len(pending_rows)
+
+                    summary = f"Imported: {imported}\nSkipped: {skipped}"
+                    if import_errors:
+                        summary += "\nFirst errors:\n" + "\n".join(import_errors[:10])
+                    messagebox.showinfo("Import Complete", summary)
                     dialog.destroy()
-                    self.refresh_data()
+                    self._refresh_after_import()
                     
                 except Exception as e:
                     messagebox.showerror("Import Error", str(e))
@@ -3231,6 +3462,13 @@ class BudgetingApp:
         except Exception as e:
             messagebox.showerror("Error", f"Failed to read CSV: {e}")
     
+    def _read_csv_columns(self, filename, columns):
+        """Read only the given CSV columns, using pyarrow when it is installed."""
+        try:
+            return pd.read_csv(filename, engine="pyarrow", usecols=columns)
+        except ImportError:
+            return pd.read_csv(filename, usecols=columns)
+
     def add_category(self):
         """Add new category"""
         name = self.category_name_entry.get()
@@ -3250,9 +3488,10 @@ class BudgetingApp:
         success, message = self.system.create_category(name, category_type, parent_id)
         
         if success:
+            self._categories_dirty = True
             messagebox.showinfo("Success", message)
             self.category_name_entry.delete(0, tk.END)
-            self.refresh_data()
+            self._refresh_category_views()
         else:
             messagebox.showerror("Error", message)
     
@@ -3270,10 +3509,34 @@ class BudgetingApp:
             messagebox.showerror("Error", "Category not found")
             return
         
+        # Build the dialog once, then just hide and refill it on later opens.
+        dlg = self._dialogs.get('category')
+        if dlg is None or not dlg["window"].winfo_exists():
+            dlg = self._build_edit_category_dialog()
+            self._dialogs['category'] = dlg
+
+        categories = self._cached_categories()
+        dlg["category_id"] = category_id
+        dlg["name_var"].set(category[2])
+        dlg["type_var"].set(category[3])
+        dlg["parent_combo"]['values'] = ["None"] + [c[2] for c in categories if c[0] != category_id]
+        dlg["parent_var"].set(self.get_category_name(category[1]) if category[1] else "None")
+        dlg["status_label"].config(text="")
+
+        dialog = dlg["window"]
+        dialog.transient(self.root)
+        dialog.deiconify()
+        dialog.lift()
+
+    def _build_edit_category_dialog(self):
+        """Create the (hidden on close) edit category dialog and return its parts."""
+        dlg = {"category_id": None}
         dialog = tk.Toplevel(self.root)
         dialog.title("Edit Category")
         dialog.geometry("360x260")
         dialog.transient(self.root)
+        # Closing only hides the window so it can be reused next time.
+        dialog.protocol("WM_DELETE_WINDOW", dialog.withdraw)
         
         ttk.Label(dialog, text="Edit Category", font=("Helvetica", 14, "bold")).pack(pady=10)
         
@@ -3281,27 +3544,25 @@ class BudgetingApp:
         form.pack(fill="both", expand=True)
         
         ttk.Label(form, text="Name:").grid(row=0, column=0, sticky="w", pady=5)
-        name_var = tk.StringVar(value=category[2])
+        name_var = tk.StringVar()
         name_entry = ttk.Entry(form, textvariable=name_var, width=30)
         name_entry.grid(row=0, column=1, pady=5)
         
         ttk.Label(form, text="Type:").grid(row=1, column=0, sticky="w", pady=5)
-        type_var = tk.StringVar(value=category[3])
+        type_var = tk.StringVar()
         type_combo = ttk.Combobox(form, values=["income", "expense"], textvariable=type_var, state="readonly", width=27)
         type_combo.grid(row=1, column=1, pady=5)
         
         ttk.Label(form, text="Parent Category:").grid(row=2, column=0, sticky="w", pady=5)
-        categories = self.system.get_categories()
-        parent_options = ["None"] + [c[2] for c in categories if c[0] != category_id]
-        current_parent = self.get_category_name(category[1]) if category[1] else "None"
-        parent_var = tk.StringVar(value=current_parent)
-        parent_combo = ttk.Combobox(form, values=parent_options, textvariable=parent_var, state="readonly", width=27)
+        parent_var = tk.StringVar()
+        parent_combo = ttk.Combobox(form, textvariable=parent_var, state="readonly", width=27)
         parent_combo.grid(row=2, column=1, pady=5)
         
         status_label = ttk.Label(form, text="", foreground="red")
         status_label.grid(row=3, column=0, columnspan=2, pady=5)
         
         def save_changes():
+            category_id = dlg["category_id"]
             name = name_var.get().strip()
             category_type = type_var.get()
             parent_name = parent_var.get()
@@ -3317,13 +3578,24 @@ class BudgetingApp:
             
             success, message = self.system.update_category(category_id, name, category_type, parent_id)
             if success:
+                self._categories_dirty = True
                 messagebox.showinfo("Success", message)
-                dialog.destroy()
+                dialog.withdraw()
                 self.refresh_data()
             else:
                 status_label.config(text=message)
         
         ttk.Button(form, text="Save Changes", command=save_changes).grid(row=4, column=0, columnspan=2, pady=10)
+
+        dlg.update({
+            "window": dialog,
+            "name_var": name_var,
+            "type_var": type_var,
+            "parent_var": parent_var,
+            "parent_combo": parent_combo,
+            "status_label": status_label,
+        })
+        return dlg
     
     def delete_category(self):
         """Delete selected category"""
@@ -3338,8 +3610,9 @@ class BudgetingApp:
         if messagebox.askyesno("Confirm Delete", "Deleting this category will remove it permanently. Continue?"):
             success, message = self.system.delete_category(category_id)
             if success:
+                self._categories_dirty = True
                 messagebox.showinfo("Success", message)
-                self.refresh_data()
+                self._refresh_category_views()
             else:
                 messagebox.showerror("Error", message)
 
@@ -3406,7 +3679,7 @@ class BudgetingApp:
         if success:
             messagebox.showinfo("Success", message)
             self.budget_limit_entry.delete(0, tk.END)
-            self.refresh_data()
+            self._refresh_budget_views()
         else:
             messagebox.showerror("Error", message)
     
@@ -3434,8 +3707,8 @@ class BudgetingApp:
         form.pack(fill="both", expand=True)
         
         ttk.Label(form, text="Category:").grid(row=0, column=0, sticky="w", pady=5)
-        categories = self.system.get_categories()
-        category_names = [c[2] for c in categories]
+        self._cached_categories()
+        category_names = self._category_names_tuple
         category_var = tk.StringVar(value=self.get_category_name(budget[2]))
         category_combo = ttk.Combobox(form, values=category_names, textvariable=category_var, state="readonly", width=27)
         category_combo.grid(row=0, column=1, pady=5)
@@ -3476,7 +3749,7 @@ class BudgetingApp:
             if success:
                 messagebox.showinfo("Success", message)
                 dialog.destroy()
-                self.refresh_data()
+                self._refresh_budget_views()
             else:
                 status_label.config(text=message)
         
@@ -3496,7 +3769,7 @@ class BudgetingApp:
             success, message = self.system.delete_budget(budget_id)
             if success:
                 messagebox.showinfo("Success", message)
-                self.refresh_data()
+                self._refresh_budget_views()
             else:
                 messagebox.showerror("Error", message)
     
@@ -3528,7 +3801,7 @@ class BudgetingApp:
             self.goal_name_entry.delete(0, tk.END)
             self.goal_target_entry.delete(0, tk.END)
             self.goal_date_entry.delete(0, tk.END)
-            self.refresh_data()
+            self._refresh_goal_views()
         else:
             messagebox.showerror("Error", message)
     
@@ -3567,9 +3840,8 @@ class BudgetingApp:
         date_entry = ttk.Entry(form, textvariable=date_var, width=20)
         date_entry.grid(row=3, column=1, pady=5)
         ttk.Label(form, text="Linked Category:").grid(row=4, column=0, sticky="w", pady=5)
-        categories = self.system.get_categories()
-        category_names = [c[2] for c in categories]
-        category_options = ["None"] + category_names
+        self._cached_categories()
+        category_options = self._category_names_with_none
         current_category = self.get_category_name(goal[2])
         if current_category not in category_options:
             current_category = "None"
@@ -3600,7 +3872,7 @@ class BudgetingApp:
             if success:
                 messagebox.showinfo("Success", message)
                 dialog.destroy()
-                self.refresh_data()
+                self._refresh_goal_views()
             else:
                 status_label.config(text=message)
         ttk.Button(form, text="Save Changes", command=save_goal).grid(row=6, column=0, columnspan=2, pady=10)
@@ -3617,7 +3889,7 @@ class BudgetingApp:
         success, message = self.system.delete_goal(goal_id)
         if success:
             messagebox.showinfo("Success", message)
-            self.refresh_data()
+            self._refresh_goal_views()
         else:
             messagebox.showerror("Error", message)
     
@@ -3637,24 +3909,28 @@ class BudgetingApp:
             messagebox.showerror("Error", "Failed to generate report")
             return
         
-        # Display in text widget
+        # Build the whole report first, then put it in the text widget in one go.
+        parts = [
+            "=== Financial Report ===\n",
+            f"Period: {report_data['period'].title()}\n",
+            f"Date Range: {report_data['start_date']} to {report_data['end_date']}\n\n",
+            f"Total Income: £{report_data['income']:.2f}\n",
+            f"Total Expenses: £{report_data['expenses']:.2f}\n",
+            f"Net Savings: £{report_data['savings']:.2f}\n\n",
+            "Category Breakdown:\n",
+        ]
+        parts.extend(
+            f"  {category}: £{amount:.2f}\n"
+            for category, amount in report_data['category_breakdown'].items()
+        )
+        parts.append("\nRecent Transactions:\n")
+        parts.extend(
+            f"  {t[3]} | {t[4]} | £{t[5]:.2f} | {t[6]}\n"
+            for t in report_data['transactions']
+        )
+
         self.report_text.delete(1.0, tk.END)
-        
-        self.report_text.insert(tk.END, f"=== Financial Report ===\n")
-        self.report_text.insert(tk.END, f"Period: {report_data['period'].title()}\n")
-        self.report_text.insert(tk.END, f"Date Range: {report_data['start_date']} to {report_data['end_date']}\n\n")
-        
-        self.report_text.insert(tk.END, f"Total Income: £{report_data['income']:.2f}\n")
-        self.report_text.insert(tk.END, f"Total Expenses: £{report_data['expenses']:.2f}\n")
-        self.report_text.insert(tk.END, f"Net Savings: £{report_data['savings']:.2f}\n\n")
-        
-        self.report_text.insert(tk.END, "Category Breakdown:\n")
-        for category, amount in report_data['category_breakdown'].items():
-            self.report_text.insert(tk.END, f"  {category}: £{amount:.2f}\n")
-        
-        self.report_text.insert(tk.END, "\nRecent Transactions:\n")
-        for t in report_data['transactions'][:10]:
-            self.report_text.insert(tk.END, f"  {t[3]} | {t[4]} | £{t[5]:.2f} | {t[6]}\n")
+        self.report_text.insert(tk.END, "".join(parts))
     
     def export_report(self, format_type):
         """Export report to file"""
@@ -3798,14 +4074,14 @@ class BudgetingApp:
         def attempt_unlock():
             password = entry.get().strip()
             if not password:
-                status_label.config(text="Please enter your password.")
+                self._status.set(status_label, text="Please enter your password.")
                 return
             if self._verify_unlock_password(password):
                 self.unlock_interface()
                 entry.delete(0, tk.END)
-                status_label.config(text="")
+                self._status.set(status_label, text="")
             else:
-                status_label.config(text="Incorrect password.")
+                self._status.set(status_label, text="Incorrect password.")
         
         ttk.Button(container, text="Unlock", command=attempt_unlock).pack(pady=(15, 0), fill="x")
         entry.focus_set()
@@ -3823,37 +4099,111 @@ class BudgetingApp:
             self.hamburger_container.lift()
     
     def _verify_unlock_password(self, password):
-        """Validate password before unlocking"""
-        return self.system.verify_current_password(password)
+        """Validate password before unlocking.
+
+        The same wrong password entered again within a second is rejected from
+        a small cache, so mashing Enter doesn't re-run the slow password hash.
+        """
+        now = time.monotonic()
+        digest = hmac.new(self._unlock_cache_key, password.encode("utf-8"), hashlib.sha256).digest()
+        self._unlock_failures = [
+            (seen, stamp) for seen, stamp in self._unlock_failures
+            if now - stamp < UNLOCK_FAILURE_TTL
+        ]
+        if any(hmac.compare_digest(seen, digest) for seen, _ in self._unlock_failures):
+            return False
+        if self.system.verify_current_password(password):
+            self._unlock_failures = []
+            return True
+        self._unlock_failures.append((digest, now))
+        del self._unlock_failures[:-UNLOCK_FAILURE_CACHE_SIZE]
+        return False
     
     def backup_data(self):
         """Backup database"""
         filename = filedialog.asksaveasfilename(
             title="Backup Database",
-            defaultextension=".sql",
-            filetypes=[("SQL files", "*.sql"), ("All files", "*.*")]
+            defaultextension=".db",
+            filetypes=BACKUP_FILETYPES
         )
         
         if filename:
-            if self.system.backup_data(filename):
-                messagebox.showinfo("Success", f"Backup saved to {filename}")
-            else:
-                messagebox.showerror("Error", "Backup failed")
+            self._run_backup_task(self.system.backup_data, filename, self._backup_finished)
+
+    def _backup_finished(self, filename, success):
+        """Tell the user how the background backup went."""
+        if success:
+            messagebox.showinfo("Success", f"Backup saved to {filename}")
+        else:
+            messagebox.showerror("Error", "Backup failed")
     
     def restore_data(self):
         """Restore database from backup"""
         filename = filedialog.askopenfilename(
             title="Restore Database",
-            filetypes=[("SQL files", "*.sql"), ("All files", "*.*")]
+            filetypes=BACKUP_FILETYPES
         )
         
         if filename:
             if messagebox.askyesno("Confirm", "This will overwrite current data. Continue?"):
-                if self.system.restore_data(filename):
-                    messagebox.showinfo("Success", "Database restored successfully")
-                    self.refresh_data()
-                else:
-                    messagebox.showerror("Error", "Restore failed")
+                # Restore writes over the live database, so block edits until it is done.
+                self._run_backup_task(
+                    self.system.restore_data, filename, self._restore_finished,
+                    busy_message="Restoring database, please wait..."
+                )
+
+    def _restore_finished(self, filename, success):
+        """Reload the app once the background restore is done."""
+        if success:
+            self._categories_dirty = True
+            messagebox.showinfo("Success", "Database restored successfully")
+            self.refresh_data()
+        else:
+            messagebox.showerror("Error", "Restore failed")
+
+    def _run_backup_task(self, task, filename, on_done, busy_message=None):
+        """Run a backup or restore on a worker thread so the window stays responsive.
+
+        With a busy_message, a modal progress window blocks input until the task ends.
+        """
+        # Backup and Restore are the first two File menu items.
+        self.file_menu.entryconfig(0, state="disabled")
+        self.file_menu.entryconfig(1, state="disabled")
+
+        busy = None
+        if busy_message:
+            busy = tk.Toplevel(self.root)
+            busy.title("Please wait")
+            busy.resizable(False, False)
+            busy.transient(self.root)
+            # Closing it early would let the user edit data mid-restore.
+            busy.protocol("WM_DELETE_WINDOW", lambda: None)
+            ttk.Label(busy, text=busy_message, padding=(20, 16, 20, 8)).pack()
+            progress = ttk.Progressbar(busy, mode="indeterminate", length=240)
+            progress.pack(padx=20, pady=(0, 16))
+            progress.start(15)
+            busy.grab_set()
+
+        def finish(success):
+            if busy is not None and busy.winfo_exists():
+                busy.grab_release()
+                busy.destroy()
+            if not self.file_menu.winfo_exists():
+                # The user logged out while the task was running.
+                return
+            self.file_menu.entryconfig(0, state="normal")
+            self.file_menu.entryconfig(1, state="normal")
+            on_done(filename, success)
+
+        def worker():
+            try:
+                success = task(filename)
+            except Exception:
+                success = False
+            # Tk widgets must only be touched from the main thread.
+            self.root.after(0, lambda: finish(success))
+
+        threading.Thread(target=worker, daemon=True).start()
     
     def show_about(self):
         """Show about dialog"""
@@ -3878,28 +4228,44 @@ class BudgetingApp:
     def _perform_logout(self):
         """Tear down current session and show login screen"""
         self.system.logout()
-        self.root.destroy()
+        self._teardown_interface()
         
         # Return to login screen - import here to avoid circular import
         from budgeting_system import BudgetingSystem
         from gui.login_window import LoginWindow
         
-        root = tk.Tk()
-        login = LoginWindow(root, BudgetingSystem())
-        root.mainloop()
+        # Keep the same Tk root (starting a new one is slow); the login
+        # window opens as a child of it, just like at start-up.
+        LoginWindow(tk.Toplevel(self.root), BudgetingSystem())
+
+    def _teardown_interface(self):
+        """Remove this app's widgets, timers and bindings from the shared root."""
+        for after_id in (self._session_after_id, self._filter_after_id, self._tx_load_after_id):
+            if after_id:
+                self.root.after_cancel(after_id)
+        self._status.cancel()
+        self.root.unbind_all("<Button-1>")
+        self.root.unbind("<Configure>")
+        self.root.config(menu="")
+        for child in self.root.winfo_children():
+            child.destroy()
+        plt.close("all")
+        self.root.withdraw()
     
     def _monitor_session(self):
         """Monitor session timeout"""
-        def check_timeout():
-            while True:
-                time.sleep(60)  # Check every minute
-                if self.system.current_user_id:
-                    if not self.system.is_session_valid():
-                        # Session expired - force logout
-                        self.root.after(0, self._session_expired)
-        
-        thread = threading.Thread(target=check_timeout, daemon=True)
-        thread.start()
+        # Tk's own timer checks once a minute; no background thread needed.
+        self._session_after_id = self.root.after(60_000, self._tick_session)
+
+    def _tick_session(self):
+        """Check the session once and schedule the next check."""
+        if self.system.current_user_id and not self.system.is_session_valid():
+            # Session expired - force logout
+            self._session_expired()
+            if not self.system.current_user_id:
+                # Logged out, so this window (and its timer) is gone.
+                return
+        self._session_after_id = self.root.after(60_000, self._tick_session)
     
     def _session_expired(self):
         """Handle session expiration"""
@@ -3,9 +3,13 @@ Login and registration window for the Smart Budgeting System.
 The look stays the same while the comments are clearer for students.
 """
 
+import textwrap
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import ttk, messagebox
 
+from gui.status_debouncer import StatusDebouncer
+
 
 class LoginWindow:
     """Login and Registration Interface"""
@@ -21,8 +25,15 @@ class LoginWindow:
         self._configure_styles()
         
         self.login_in_progress = False
+        # Status label changes are drawn once per burst of messages.
+        self._status = StatusDebouncer(self.root)
         self.create_widgets()
 
+        # The main root stays hidden while logging in, so closing this window
+        # should close the whole program.
+        if isinstance(self.root, tk.Toplevel) and self.root.master:
+            self.root.protocol("WM_DELETE_WINDOW", self.root.master.destroy)
+
     def _configure_styles(self):
         """Apply a light, clean style that matches the main app theme"""
         style = ttk.Style(self.root)
@@ -60,6 +71,15 @@ class LoginWindow:
             foreground=[("active", "#000000")]
         )
     
+    def _wrap_text(self, text, font, width):
+        """Wrap text once to roughly fit a pixel width.
+
+        Fixed line breaks stop Tk re-measuring the text every time the window
+        is laid out, which wraplength would do.
+        """
+        average = tkfont.Font(root=self.root, font=font).measure(text) / max(len(text), 1)
+        return textwrap.fill(text, width=max(int(width // max(average, 1)), 1))
+    
     def create_widgets(self):
         """Create login/register UI"""
         container = tk.Frame(self.root, bg="#f2f2f2")
@@ -76,20 +96,22 @@ class LoginWindow:
         hero.columnconfigure(0, weight=1)
         tk.Label(
             hero,
-            text="Smart Budgeting System",
+            text=self._wrap_text("Smart Budgeting System", ("Helvetica Neue", 20, "bold"), 240),
             font=("Helvetica Neue", 20, "bold"),
             fg="#ffffff",
             bg="#111111",
-            justify="left",
-            wraplength=240
+            justify="left"
         ).grid(row=0, column=0, sticky="w", pady=(4, 8))
         tk.Label(
             hero,
-            text="Stay on top of your goals with quick insights and a clean workspace.",
+            text=self._wrap_text(
+                "Stay on top of your goals with quick insights and a clean workspace.",
+                ("Helvetica Neue", 11),
+                260
+            ),
             font=("Helvetica Neue", 11),
             fg="#e0e0e0",
             bg="#111111",
-            wraplength=260,
             justify="left"
         ).grid(row=1, column=0, sticky="w")
         tk.Label(hero, text="£", font=("Helvetica Neue", 34, "bold"), fg="#111111", bg="#ffffff",
@@ -146,19 +168,19 @@ class LoginWindow:
         password = self.password_entry.get()
         
         if not username or not password:
-            self.status_label.config(text="Please fill all fields")
+            self._status.set(self.status_label, text="Please fill all fields")
             return
         
         success, message = self.system.login(username, password)
         
         if success:
             self.login_in_progress = True
-            self.status_label.config(text="Login successful. Opening dashboard...", foreground="#111111")
+            self._status.set(self.status_label, text="Login successful. Opening dashboard...", foreground="#111111")
             self.login_button.state(["disabled"])
             self.register_button.state(["disabled"])
             self.root.after(3000, self._complete_login)
         else:
-            self.status_label.config(text=message, foreground="#111111")
+            self._status.set(self.status_label, text=message, foreground="#111111")
 
     def _complete_login(self):
         """Finish login after delay."""
@@ -203,9 +225,12 @@ class LoginWindow:
 
         form_frame = tk.Frame(dialog, bg="#f2f2f2", padx=20, pady=18)
         form_frame.pack(fill="both", expand=True)
-        card = ttk.Frame(form_frame, style="LoginCard.TFrame", padding=20)
+        card = ttk.Frame(form_frame, style="LoginCard.TFrame", padding=20, width=480, height=400)
         card.pack(expand=True, fill="both")
         card.columnconfigure(1, weight=1)
+        # Hold the card at a fixed size while its widgets are added so Tk
+        # only works out the grid layout once at the end.
+        card.grid_propagate(False)
         
         # Username
         ttk.Label(card, text="Username", style="LoginLabel.TLabel").grid(row=0, column=0, sticky="w", pady=(0, 6))
@@ -229,7 +254,8 @@ class LoginWindow:
         
         # Requirements label
         req_text = "Password requirements: 8+ chars, upper & lower case, number, and symbol."
-        ttk.Label(card, text=req_text, style="Helper.TLabel", wraplength=360).grid(
+        req_text = self._wrap_text(req_text, ("Helvetica Neue", 10), 360)
+        ttk.Label(card, text=req_text, style="Helper.TLabel").grid(
             row=4, column=0, columnspan=2, sticky="w", pady=(0, 12)
         )
         
@@ -266,11 +292,11 @@ class LoginWindow:
             confirm = reg_confirm.get()
             
             if not all([username, email, password, confirm]):
-                status_label.config(text="Please fill all fields", foreground="#111111")
+                self._status.set(status_label, text="Please fill all fields", foreground="#111111")
                 return
             
             if password != confirm:
-                status_label.config(text="Passwords do not match", foreground="#111111")
+                self._status.set(status_label, text="Passwords do not match", foreground="#111111")
                 return
             
             success, message = self.system.register_user(username, email, password)
@@ -281,12 +307,12 @@ class LoginWindow:
                 self.username_entry.insert(0, username)
                 self.password_entry.delete(0, tk.END)
                 self.password_entry.insert(0, password)
-                self.status_label.config(text="Account created. You can sign in now.", foreground="#111111")
+                self._status.set(self.status_label, text="Account created. You can sign in now.", foreground="#111111")
                 dialog.destroy()
                 if autologin_var.get():
                     self.login()
             else:
-                status_label.config(text=message, foreground="#111111")
+                self._status.set(status_label, text=message, foreground="#111111")
         
         ttk.Button(button_frame, text="Create Account", style="Primary.TButton", command=register).grid(
             row=0, column=0, sticky="ew", padx=(0, 8)
@@ -294,3 +320,4 @@ class LoginWindow:
         ttk.Button(button_frame, text="Cancel", style="Ghost.TButton", command=dialog.destroy).grid(
             row=0, column=1, sticky="ew", padx=(8, 0)
         )
+        card.grid_propagate(True)
@@ -0,0 +1,37 @@
+"""
+Small helper that debounces status label updates.
+Quick bursts of messages only repaint each label once, with the latest text.
+"""
+
+
+class StatusDebouncer:
+    """Queue label changes and apply them together a moment later."""
+
+    def __init__(self, widget, delay=50):
+        # Any widget works; it is only used to schedule after() callbacks.
+        self.widget = widget
+        self.delay = delay
+        self._pending = {}
+        self._after_id = None
+
+    def set(self, label, **options):
+        """Queue a config change for a label (later calls replace earlier ones)."""
+        self._pending[label] = options
+        if self._after_id is None:
+            self._after_id = self.widget.after(self.delay, self.flush)
+
+    def flush(self):
+        """Apply only the latest queued options for each label."""
+        self._after_id = None
+        pending, self._pending = self._pending, {}
+        for label, options in pending.items():
+            # The label may have been destroyed while the update was waiting.
+            if label.winfo_exists():
+                label.config(**options)
+
+    def cancel(self):
+        """Drop any queued updates and the pending callback."""
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
+        self._pending = {}
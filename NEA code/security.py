@@ -3,15 +3,32 @@ Security helper functions for hashing, tokens, and password checks.
 Written in a simple, student-friendly style without changing behaviour.
 """
 
+import base64
 import hashlib
+import hmac
+import os
 import re
 import secrets
 import string
 
+# scrypt cost settings. They are saved inside every hash, so they can be
+# raised later without breaking passwords that were hashed with older values.
+SCRYPT_N = 2 ** 14
+SCRYPT_R = 8
+SCRYPT_P = 1
+SCRYPT_DKLEN = 32
+
+# Compiled once. The domain is matched as dot-separated labels so the
+# pattern cannot backtrack badly on long strings with no match.
+_EMAIL_RE = re.compile(r"[A-Za-z0-9._%+-]+@(?:[A-Za-z0-9-]+\.)+[A-Za-z]{2,}")
+
 
 class SecurityManager:
     """Handles hashing, token generation, and password validation."""
 
+    # Set of punctuation characters, so each membership check is a hash lookup.
+    _PUNCT = frozenset(string.punctuation)
+
     @staticmethod
     def generate_salt():
         """Create a random salt for password hashing."""
@@ -19,39 +36,93 @@ class SecurityManager:
 
     @staticmethod
     def hash_password(password, salt):
-        """Hash a password with SHA-256 and the provided salt."""
-        return hashlib.sha256((password + salt).encode()).hexdigest()
+        """Hash a password with scrypt and the provided salt."""
+        digest = hashlib.scrypt(
+            password.encode("utf-8"),
+            salt=bytes.fromhex(salt),
+            n=SCRYPT_N,
+            r=SCRYPT_R,
+            p=SCRYPT_P,
+            dklen=SCRYPT_DKLEN,
+        )
+        # Stored as "scrypt$n$r$p$hexdigest" so verify_password can re-derive it.
+        return f"scrypt${SCRYPT_N}${SCRYPT_R}${SCRYPT_P}${digest.hex()}"
+
+    @staticmethod
+    def _hash_pw_bytes(pw_bytes, salt_bytes):
+        """Raw SHA-256 digest of already-encoded password and salt bytes."""
+        # Feeding the two parts separately gives the same hash as password + salt
+        # without building a joined string first.
+        digest = hashlib.sha256()
+        digest.update(pw_bytes)
+        digest.update(salt_bytes)
+        return digest.digest()
+
+    @staticmethod
+    def is_legacy_hash(stored_hash):
+        """True if a stored hash was made by the old SHA-256 scheme."""
+        return not stored_hash.startswith("scrypt$")
+
+    @staticmethod
+    def _verify_pw_bytes(pw_bytes, salt, stored_hash):
+        """Check already-encoded password bytes against one stored hash."""
+        # compare_digest takes the same time wherever the first difference is.
+        if SecurityManager.is_legacy_hash(stored_hash):
+            digest = SecurityManager._hash_pw_bytes(pw_bytes, salt.encode())
+            return hmac.compare_digest(digest.hex(), stored_hash)
+
+        # Re-derive with the settings saved alongside the hash.
+        _, n, r, p, hex_digest = stored_hash.split("$")
+        expected = bytes.fromhex(hex_digest)
+        digest = hashlib.scrypt(
+            pw_bytes,
+            salt=bytes.fromhex(salt),
+            n=int(n),
+            r=int(r),
+            p=int(p),
+            dklen=len(expected),
+        )
+        return hmac.compare_digest(digest, expected)
 
     @staticmethod
     def verify_password(password, salt, stored_hash):
         """Check if a password matches a stored hash."""
-        return SecurityManager.hash_password(password, salt) == stored_hash
+        return SecurityManager._verify_pw_bytes(password.encode("utf-8"), salt, stored_hash)
 
     @staticmethod
     def generate_session_token():
         """Make a random session token string."""
-        return secrets.token_urlsafe(32)
+        # 24 random bytes (192 bits) become 32 URL-safe characters.
+        return base64.urlsafe_b64encode(os.urandom(24)).rstrip(b"=").decode("ascii")
 
     @staticmethod
     def validate_password_strength(password):
         """Confirm a password meets length and complexity rules."""
         if len(password) < 8:
             return False, "Password must be at least 8 characters"
-        if not any(char.isupper() for char in password):
+
+        # map() with the str methods runs the character checks in C, and any()
+        # still stops at the first match.
+        has_upper = any(map(str.isupper, password))
+        has_lower = any(map(str.islower, password))
+        has_digit = any(map(str.isdigit, password))
+        has_special = not SecurityManager._PUNCT.isdisjoint(password)
+
+        # Same order of messages as before.
+        if not has_upper:
             return False, "Password must contain uppercase letter"
-        if not any(char.islower() for char in password):
+        if not has_lower:
             return False, "Password must contain lowercase letter"
-        if not any(char.isdigit() for char in password):
+        if not has_digit:
             return False, "Password must contain number"
-        if not any(char in string.punctuation for char in password):
+        if not has_special:
             return False, "Password must contain special character"
         return True, "Password is strong"
 
     @staticmethod
     def validate_email_format(email):
         """Check that an email looks like user@domain.com."""
-        pattern = r"^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}$"
-        if not re.match(pattern, email):
+        if not _EMAIL_RE.fullmatch(email):
             return False, "Email must be in the form user@domain.com"
         return True, "Email is valid"
 
@@ -61,9 +132,10 @@ class SecurityManager:
         if not history_records:
             return False
 
+        # Encode once; each record only needs its own salt hashed in.
+        pw_bytes = password.encode("utf-8")
         for record in history_records:
             stored_hash, salt = record[0], record[1]
-            # Reuse verify_password to check each old pair.
-            if SecurityManager.verify_password(password, salt, stored_hash):
+            if SecurityManager._verify_pw_bytes(pw_bytes, salt, stored_hash):
                 return True
         return False
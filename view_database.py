@@ -2,77 +2,236 @@
 """
 Database Viewer for Smart Budgeting System
 Quick script to view database contents (no external dependencies)
+
+Usage:
+    python view_database.py [db_path] [table_name] [flags]
+
+    db_path       database file (default: smart_budgeting_system.db)
+    table_name    show only this table (default: every table)
+
+Flags:
+    --all             show every row; on a terminal each table stops at 1000 rows
+    --format=FORMAT   text (default), csv or jsonl; csv/jsonl need a table name
+    --count-first     count each table's rows before printing them (extra scan)
+    --fast            print through the sqlite3 command line tool if installed
+    --help            show this message
+
+Password and salt columns are always hidden.
 """
 
+import contextlib
+import csv
+import json
+import shutil
 import sqlite3
+import subprocess
 import sys
 import os
+from pathlib import Path
+
+try:
+    import orjson  # Optional, faster JSON encoding for --format=jsonl
+except ImportError:
+    orjson = None
+
+# Rows collected before each write to stdout
+OUTPUT_BATCH_ROWS = 1000
+
+# Rows shown per table on a terminal unless --all is passed
+TTY_ROW_LIMIT = 1000
+
+# Values accepted by --format
+OUTPUT_FORMATS = ("text", "csv", "jsonl")
+
+
+def _connect(db_path):
+    """Open the database read-only for viewing"""
+    # Read-only mode never creates journal files or takes a write lock
+    uri = Path(db_path).resolve().as_uri() + "?mode=ro"
+    # Only a few statements are ever prepared, so keep the cache small
+    conn = sqlite3.connect(uri, uri=True, cached_statements=8, isolation_level=None)
+    conn.execute("PRAGMA query_only = 1")
+    # Let SQLite memory-map the file instead of reading it page by page
+    conn.execute("PRAGMA mmap_size = 268435456")
+    return conn
+
+
+def _q(ident):
+    """Quote a table name for use in SQL"""
+    return '"' + ident.replace('"', '""') + '"'
+
+
+def _load_schemas(cursor):
+    """Get every table's column names in one query, as {table: [columns]}"""
+    schemas = {}
+    cursor.execute(
+        "SELECT m.name, p.name FROM sqlite_master m "
+        "JOIN pragma_table_info(m.name) p "
+        "WHERE m.type='table' AND m.name != 'sqlite_sequence' "
+        "ORDER BY m.name, p.cid"
+    )
+    for schema_table, col_name in cursor:
+        schemas.setdefault(schema_table, []).append(col_name)
+    return schemas
+
+
+def _masked_columns(column_names):
+    """Get the indexes of password and salt columns"""
+    return {
+        index for index, col_name in enumerate(column_names)
+        if 'password' in col_name.lower() or 'salt' in col_name.lower()
+    }
+
+
+def _select_rows(cursor, table_name, limit=None):
+    """Run the SELECT for a table's rows (up to limit) on the cursor"""
+    if limit is None:
+        cursor.execute(f"SELECT * FROM {_q(table_name)}")
+    else:
+        cursor.execute(f"SELECT * FROM {_q(table_name)} LIMIT ?", (limit,))
+    return cursor
+
+
+def _to_json(row_dict):
+    """Encode one row as JSON, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(row_dict, default=str).decode("utf-8")
+    return json.dumps(row_dict, default=str)
+
+
+def _export_rows(cursor, table_name, column_names, output_format):
+    """Write a table's rows as CSV or JSON lines for other programs to read"""
+    masked = _masked_columns(column_names)
+    rows = _select_rows(cursor, table_name)
+    if masked:
+        # Mask password hashes for security
+        rows = (
+            tuple(
+                ("***HIDDEN***" if value else None) if index in masked else value
+                for index, value in enumerate(row)
+            )
+            for row in rows
+        )
+    
+    if output_format == "csv":
+        # csv.writer loops over the rows in C
+        writer = csv.writer(sys.stdout)
+        writer.writerow(column_names)
+        writer.writerows(rows)
+        return
+    
+    write = sys.stdout.write
+    output = []
+    for row in rows:
+        output.append(_to_json(dict(zip(column_names, row))))
+        if len(output) >= OUTPUT_BATCH_ROWS:
+            write("\n".join(output) + "\n")
+            output.clear()
+    if output:
+        write("\n".join(output) + "\n")
+
+
+def _dump_rows(cursor, table_name, column_names, limit=None):
+    """Print the rows of a table (up to limit), hiding password and salt values.
+
+    Returns (rows printed, whether more rows were left out by the limit).
+    """
+    # Local names are quicker to look up inside the loop
+    write = sys.stdout.write
+    join = "\n".join
+    # Work out which columns to mask once, not for every row
+    masked = _masked_columns(column_names)
+    
+    # Print each row as it is read instead of loading them all
+    # (written in batches rather than one print per line)
+    output = []
+    shown = 0
+    truncated = False
+    # Ask for one extra row so we know whether the limit really cut anything off
+    fetch_limit = None if limit is None else limit + 1
+    for i, row in enumerate(_select_rows(cursor, table_name, fetch_limit), 1):
+        if limit is not None and i > limit:
+            truncated = True
+            break
+        lines = [f"Row {i}:"]
+        for index, (col_name, value) in enumerate(zip(column_names, row)):
+            # Mask password hashes for security
+            if index in masked:
+                value = "***HIDDEN***" if value else None
+            lines.append(f"  {col_name}: {value}")
+        output.append(join(lines) + "\n\n")
+        shown = i
+        if len(output) >= OUTPUT_BATCH_ROWS:
+            write("".join(output))
+            output.clear()
+    write("".join(output))
+    return shown, truncated
+
+
+def _count_rows(cursor, table_name, count_first=False):
+    """Get (row count or None, whether the table has any rows)"""
+    if count_first:
+        row_count = cursor.execute(f"SELECT COUNT(*) FROM {_q(table_name)}").fetchone()[0]
+        return row_count, row_count > 0
+    # COUNT(*) reads the whole table, but EXISTS stops at the first row
+    has_rows = cursor.execute(f"SELECT EXISTS (SELECT 1 FROM {_q(table_name)})").fetchone()[0]
+    return None, bool(has_rows)
+
+
+def _print_rows_footer(shown, truncated, row_count, limit):
+    """Print the row count if it wasn't known up front, and say if rows were left out"""
+    if row_count is None:
+        if truncated:
+            print(f"Rows shown: {shown}")
+            print(f"(showing first {limit} rows; pass --all to dump everything)")
+        else:
+            print(f"Rows: {shown}")
+    elif truncated:
+        print(f"(showing first {limit} of {row_count} rows; pass --all to dump everything)")
 
 
-def view_database(db_path="smart_budgeting_system.db"):
+def view_database(db_path="smart_budgeting_system.db", limit=None, count_first=False):
     """View all tables and their contents"""
     if not os.path.exists(db_path):
         print(f"Error: Database file '{db_path}' not found.")
         return
     
     try:
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row  # This allows column access by name
-        cursor = conn.cursor()
-        
-        # Get all tables
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' ORDER BY name")
-        tables = cursor.fetchall()
-        
-        if not tables:
-            print("No tables found in database.")
-            return
-        
-        print("=" * 80)
-        print("SMART BUDGETING SYSTEM DATABASE VIEWER")
-        print("=" * 80)
-        print(f"\nDatabase: {db_path}\n")
-        
-        for table in tables:
-            table_name = table[0]
-            if table_name == 'sqlite_sequence':
-                continue  # Skip SQLite internal table
+        with contextlib.closing(_connect(db_path)) as conn:
+            work_cur = conn.cursor()
             
-            print(f"\n{'=' * 80}")
-            print(f"TABLE: {table_name.upper()}")
-            print(f"{'=' * 80}")
+            # Tables in name order (without sqlite_sequence) with their columns
+            schemas = _load_schemas(work_cur)
             
-            # Get table schema
-            cursor.execute(f"PRAGMA table_info({table_name})")
-            columns = cursor.fetchall()
-            column_names = [col[1] for col in columns]
+            if not schemas:
+                print("No tables found in database.")
+                return
             
-            # Get all data
-            cursor.execute(f"SELECT * FROM {table_name}")
-            rows = cursor.fetchall()
+            print("=" * 80)
+            print("SMART BUDGETING SYSTEM DATABASE VIEWER")
+            print("=" * 80)
+            print(f"\nDatabase: {db_path}\n")
             
-            if rows:
-                # Print column headers
-                print(f"\nColumns: {', '.join(column_names)}")
-                print(f"Rows: {len(rows)}\n")
-                print("-" * 80)
+            for table_name, column_names in schemas.items():
+                print(f"\n{'=' * 80}")
+                print(f"TABLE: {table_name.upper()}")
+                print(f"{'=' * 80}")
                 
-                # Print each row
-                for i, row in enumerate(rows, 1):
-                    print(f"Row {i}:")
-                    for col_name in column_names:
-                        value = row[col_name]
-                        # Mask password hashes for security
-                        if 'password' in col_name.lower() or 'salt' in col_name.lower():
-                            value = "***HIDDEN***" if value else None
-                        print(f"  {col_name}: {value}")
-                    print()
-            else:
-                print("\n(No data in this table)")
-            
-            print()
-        
-        conn.close()
+                # Only count up front when asked, otherwise count while printing
+                row_count, has_rows = _count_rows(work_cur, table_name, count_first)
+                
+                if has_rows:
+                    # Print column headers
+                    print(f"\nColumns: {', '.join(column_names)}")
+                    print(f"Rows: {'?' if row_count is None else row_count}\n")
+                    print("-" * 80)
+                    
+                    shown, truncated = _dump_rows(work_cur, table_name, column_names, limit)
+                    _print_rows_footer(shown, truncated, row_count, limit)
+                else:
+                    print("\n(No data in this table)")
+                
+                print()
         
     except sqlite3.Error as e:
         print(f"Database error: {e}")
@@ -80,50 +239,126 @@ def view_database(db_path="smart_budgeting_system.db"):
         print(f"Error: {e}")
 
 
-def view_table(db_path="smart_budgeting_system.db", table_name=None):
-    """View a specific table"""
+def view_table(db_path="smart_budgeting_system.db", table_name=None, limit=None, output_format="text",
+               count_first=False):
+    """View a specific table (as text, CSV or JSON lines)"""
     try:
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        if table_name:
-            cursor.execute(f"SELECT * FROM {table_name}")
-            rows = cursor.fetchall()
-            
-            # Get column names
-            cursor.execute(f"PRAGMA table_info({table_name})")
-            columns = cursor.fetchall()
-            column_names = [col[1] for col in columns]
-            
-            print(f"\n{table_name.upper()} Table")
-            print("=" * 80)
-            print(f"Columns: {', '.join(column_names)}")
-            print(f"Rows: {len(rows)}\n")
+        with contextlib.closing(_connect(db_path)) as conn:
+            cursor = conn.cursor()
             
-            if rows:
-                for i, row in enumerate(rows, 1):
-                    print(f"Row {i}:")
-                    for col_name in column_names:
-                        value = row[col_name]
-                        if 'password' in col_name.lower() or 'salt' in col_name.lower():
-                            value = "***HIDDEN***" if value else None
-                        print(f"  {col_name}: {value}")
-                    print()
-            else:
-                print("(No data)")
-        
-        conn.close()
+            if table_name:
+                # Only accept names of tables that really exist
+                cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+                valid = {row[0] for row in cursor}
+                if table_name not in valid:
+                    print(f"Error: Table '{table_name}' not found.")
+                    return
+                
+                # Get column names (bound parameter, so the statement is reused)
+                column_names = [
+                    row[0] for row in cursor.execute("SELECT name FROM pragma_table_info(?)", (table_name,))
+                ]
+                
+                if output_format != "text":
+                    _export_rows(cursor, table_name, column_names, output_format)
+                    return
+                
+                row_count, has_rows = _count_rows(cursor, table_name, count_first)
+                
+                print(f"\n{table_name.upper()} Table")
+                print("=" * 80)
+                print(f"Columns: {', '.join(column_names)}")
+                if row_count is None:
+                    row_count_text = "?" if has_rows else "0"
+                else:
+                    row_count_text = row_count
+                print(f"Rows: {row_count_text}\n")
+                
+                if has_rows:
+                    shown, truncated = _dump_rows(cursor, table_name, column_names, limit)
+                    _print_rows_footer(shown, truncated, row_count, limit)
+                else:
+                    print("(No data)")
         
     except sqlite3.Error as e:
         print(f"Database error: {e}")
 
 
+def view_with_cli(db_path="smart_budgeting_system.db", table_name=None, limit=None):
+    """View tables through the sqlite3 command line shell, which formats rows in C.
+
+    Returns False if the shell isn't installed, so the normal viewer can be used.
+    """
+    sqlite_cli = shutil.which("sqlite3")
+    if sqlite_cli is None:
+        return False
+    if not os.path.exists(db_path):
+        print(f"Error: Database file '{db_path}' not found.")
+        return True
+    
+    try:
+        with contextlib.closing(_connect(db_path)) as conn:
+            schemas = _load_schemas(conn.cursor())
+    except sqlite3.Error as e:
+        print(f"Database error: {e}")
+        return True
+    
+    if table_name is not None:
+        if table_name not in schemas:
+            print(f"Error: Table '{table_name}' not found.")
+            return True
+        schemas = {table_name: schemas[table_name]}
+    
+    script = []
+    for name, column_names in schemas.items():
+        # Mask password hashes in the query itself, since the shell prints raw values
+        masked = _masked_columns(column_names)
+        columns = ", ".join(
+            f"CASE WHEN {_q(col_name)} IS NULL OR {_q(col_name)} IN ('', 0) THEN NULL "
+            f"ELSE '***HIDDEN***' END AS {_q(col_name)}" if index in masked else _q(col_name)
+            for index, col_name in enumerate(column_names)
+        )
+        title = "'" + f"TABLE: {name.upper()}".replace("'", "''") + "'"
+        query = f"SELECT {columns} FROM {_q(name)}"
+        if limit is not None:
+            query += f" LIMIT {int(limit)}"
+        script += [
+            ".headers off", ".mode list", f"SELECT char(10) || {title};",
+            ".headers on", ".mode column", query + ";",
+        ]
+    
+    subprocess.run([sqlite_cli, "-readonly", db_path], input="\n".join(script) + "\n", text=True)
+    return True
+
+
 if __name__ == "__main__":
-    db_path = sys.argv[1] if len(sys.argv) > 1 else "smart_budgeting_system.db"
-    table_name = sys.argv[2] if len(sys.argv) > 2 else None
+    flags = [arg for arg in sys.argv[1:] if arg.startswith("--")]
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    if "--help" in flags:
+        print(__doc__.strip())
+        sys.exit(0)
+    db_path = args[0] if len(args) > 0 else "smart_budgeting_system.db"
+    table_name = args[1] if len(args) > 1 else None
+    # Counting rows first costs an extra full scan of every table
+    count_first = "--count-first" in flags
+    output_format = "text"
+    for flag in flags:
+        if flag.startswith("--format="):
+            output_format = flag.split("=", 1)[1]
+    # Nobody reads thousands of rows on a terminal, so only fetch the first few.
+    # CSV and JSON lines are meant for other programs, so they always get every row.
+    if "--all" in flags or output_format != "text" or not sys.stdout.isatty():
+        limit = None
+    else:
+        limit = TTY_ROW_LIMIT
     
-    if table_name:
-        view_table(db_path, table_name)
+    if output_format not in OUTPUT_FORMATS:
+        print(f"Error: Unknown format '{output_format}'. Use one of: {', '.join(OUTPUT_FORMATS)}.")
+    elif output_format != "text" and not table_name:
+        print("Error: --format=csv and --format=jsonl need a table name.")
+    elif "--fast" in flags and output_format == "text" and view_with_cli(db_path, table_name, limit):
+        pass  # The sqlite3 shell printed everything
+    elif table_name:
+        view_table(db_path, table_name, limit, output_format, count_first)
     else:
-        view_database(db_path)
+        view_database(db_path, limit, count_first)